@@ -37,17 +37,41 @@ from .schema_setup import SchemaSetup
 from .sql_templates import SQL_TEMPLATES, get_required_tables
 from .decorators import with_db_connection
 
-# Import mock package
-from .mock import SchemaRegistry, MockDataGenerator
+import importlib
 
-# Import testing package
-from .testing import TestTransactionManager, with_transaction
+# Testing and tooling subpackages are loaded on first attribute access (PEP 562)
+# so processes that only need the core connector don't pay for them
+_LAZY_IMPORTS = {
+    # Mock package
+    'SchemaRegistry': '.mock',
+    'MockDataGenerator': '.mock',
+    
+    # Testing package
+    'TestTransactionManager': '.testing',
+    'with_transaction': '.testing',
+    
+    # Performance package
+    'QueryLogger': '.performance',
+    'QueryLogEntry': '.performance',
+    'time_query': '.performance',
+    
+    # Sync package
+    'DatabaseSyncManager': '.sync',
+}
+
+
+def __getattr__(name):
+    """Import lazily exported names on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
-# Import performance package
-from .performance import QueryLogger, QueryLogEntry, time_query
 
-# Import sync package
-from .sync import DatabaseSyncManager
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 __all__ = [
     # Core classes
@@ -9,19 +9,133 @@ connections, query execution, and transaction management.
 """
 
 import asyncio
+import io
+import json
 import logging
 import os
+import re
+import sys
 import time
+import weakref
 from contextlib import asynccontextmanager
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional, Sequence, Tuple, Union
 
 import asyncpg
 from asyncpg.transaction import Transaction
 
 from config.settings import DB_CONFIG, TEST_MODE
 
+# orjson is optional; it decodes JSON several times faster than the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Default pool ceiling: never below the historical 20, scaled up on larger hosts
+DEFAULT_POOL_MAX = max(20, (os.cpu_count() or 1) * 2)
+
+def _pool_settings() -> Dict[str, Any]:
+    """
+    Build asyncpg pool sizing and lifetime options from DB_CONFIG.
+    
+    Recognized keys: pool_min, pool_max, pool_max_queries,
+    pool_max_inactive_lifetime, command_timeout, stmt_cache_size,
+    stmt_cache_ttl and pgbouncer. acquire_timeout is read at checkout time.
+    
+    Returns:
+        Keyword arguments for asyncpg.create_pool
+    """
+    min_size = DB_CONFIG.get("pool_min", 5)
+    max_size = max(DB_CONFIG.get("pool_max", DEFAULT_POOL_MAX), min_size)
+    
+    # PgBouncer in transaction mode cannot keep named statements per client
+    stmt_cache_size = 0 if DB_CONFIG.get("pgbouncer") else DB_CONFIG.get("stmt_cache_size", 1024)
+    
+    return {
+        "min_size": min_size,
+        "max_size": max_size,
+        "max_queries": DB_CONFIG.get("pool_max_queries", 50000),
+        "max_inactive_connection_lifetime": DB_CONFIG.get("pool_max_inactive_lifetime", 300.0),
+        # No limit unless configured: scripts, COPY loads and bulk writes can
+        # legitimately run for minutes
+        "command_timeout": DB_CONFIG.get("command_timeout"),
+        "statement_cache_size": stmt_cache_size,
+        # Recycle cached plans so a generic plan cannot outlive data changes
+        "max_cached_statement_lifetime": DB_CONFIG.get("stmt_cache_ttl", 300),
+    }
+
+# Plain, unquoted identifiers only; anything else never reaches set_config()
+_SCHEMA_NAME_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+
+# Result shape requested from execute(): single value, one row, all rows,
+# status string or affected row count
+ExecuteMode = Literal["val", "row", "all", "exec", "count"]
+
+def _json_default(value: Any) -> str:
+    """
+    Encode the values orjson handles natively but json.dumps does not.
+    
+    Dates and times use ISO 8601, as orjson writes them, and anything else
+    (UUIDs, for instance) its string form.
+    """
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+def _json_encode(value: Any) -> str:
+    """
+    Encode a value for a json/jsonb parameter.
+    
+    Strings are passed through untouched because callers have always handed
+    pre-serialized JSON text to these columns.
+    """
+    if isinstance(value, str):
+        return value
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    # Accept the same values as the orjson path, so whether a parameter
+    # encodes does not depend on an optional dependency
+    return json.dumps(value, default=_json_default)
+
+_json_decode = orjson.loads if orjson is not None else json.loads
+
+# The binary jsonb format is the JSON text prefixed with a version byte.
+# Binary codecs also let copy_records_to_table load json/jsonb columns.
+_JSONB_VERSION = b"\x01"
+
+def _jsonb_encode(value: Any) -> bytes:
+    """Encode a value as binary jsonb."""
+    return _JSONB_VERSION + _json_encode(value).encode()
+
+def _jsonb_decode(data: bytes) -> Any:
+    """Decode binary jsonb, skipping the version byte."""
+    return _json_decode(data[1:])
+
+# (encoder, decoder) per JSON type, registered in binary format
+_JSON_CODECS = {
+    "json": (lambda value: _json_encode(value).encode(), _json_decode),
+    "jsonb": (_jsonb_encode, _jsonb_decode),
+}
+
+def _raw_connection(conn):
+    """Return the physical connection behind a pool connection proxy."""
+    return getattr(conn, "_con", None) or conn
+
+async def _prepare_statement(conn, query: str):
+    """
+    Prepare a query through asyncpg's per-connection statement cache.
+    
+    Connection.prepare() always sends a fresh Parse; the internal _prepare()
+    with use_cache=True is what fetch() uses, so a statement parsed once on a
+    physical connection is reused across pool checkouts.
+    """
+    prepare = getattr(_raw_connection(conn), "_prepare", None)
+    if prepare is None:
+        return await conn.prepare(query)
+    return await prepare(query, use_cache=True)
+
 class ConnectionError(Exception):
     """
     Connection-related errors.
@@ -49,6 +163,53 @@ class TransactionError(Exception):
     """
     pass
 
+class SchemaError(Exception):
+    """
+    Schema-related errors.
+    
+    These errors occur when a table, column or schema that an operation
+    depends on is missing or does not match what the caller expects.
+    """
+    pass
+
+class ConnectionWrapper:
+    """
+    Thin wrapper around a transaction connection adding dictionary fetch helpers.
+    
+    execute, fetchval, fetchrow and fetch are the connection's own bound
+    methods, stored on the instance, so calling them adds no Python frame
+    on top of asyncpg.
+    
+    Attributes:
+        connection: The underlying asyncpg connection
+    """
+    
+    __slots__ = ("connection", "execute", "fetchval", "fetchrow", "fetch")
+    
+    def __init__(self, connection):
+        self.connection = connection
+        self.execute = connection.execute
+        self.fetchval = connection.fetchval
+        self.fetchrow = connection.fetchrow
+        self.fetch = connection.fetch
+        
+    async def fetch_dict(self, query, *args):
+        row = await self.connection.fetchrow(query, *args)
+        return dict(row) if row else None
+        
+    async def fetch_all_dict(self, query, *args):
+        rows = await self.connection.fetch(query, *args)
+        return [dict(row) for row in rows] if rows else []
+        
+    async def execute_params(self, query, params_tuple):
+        """
+        Execute a query with its parameters given as a single tuple.
+        
+        Kept for callers still written as ``conn.execute(q, (a, b))``; prefer
+        passing parameters positionally to ``execute``.
+        """
+        return await self.connection.execute(query, *params_tuple)
+
 class DBConnector:
     """
     PostgreSQL connector with connection pooling via asyncpg.
@@ -58,9 +219,21 @@ class DBConnector:
     
     Attributes:
         _pool: Shared connection pool for database connections
+        _stmt_cache: Prepared statements memoized per physical connection
+        _search_paths: Last search_path set on each physical connection
+        _pool_lock: Lock guarding one-time pool creation
+        _checkout_sem: Caps coroutines holding or waiting for a connection
+        _pool_loop: Event loop the pool, lock and semaphore belong to
+        _warmup_queries: Queries prepared on every new connection
     """
     
     _pool = None
+    _pool_lock: Optional[asyncio.Lock] = None
+    _checkout_sem: Optional[asyncio.Semaphore] = None
+    _pool_loop: Optional[asyncio.AbstractEventLoop] = None
+    _stmt_cache: "weakref.WeakKeyDictionary[asyncpg.Connection, Dict[str, asyncpg.prepared_stmt.PreparedStatement]]" = weakref.WeakKeyDictionary()
+    _search_paths: "weakref.WeakKeyDictionary[asyncpg.Connection, Optional[str]]" = weakref.WeakKeyDictionary()
+    _warmup_queries: List[str] = list(DB_CONFIG.get("warmup_queries", ()))
     
     @classmethod
     async def get_pool(cls):
@@ -73,37 +246,387 @@ class DBConnector:
         Raises:
             ConnectionError: If the connection pool cannot be created
         """
-        if cls._pool is None:
-            logger.info("Initializing asyncpg database connection pool")
-            logger.info(f"Using database configuration: {DB_CONFIG}")
+        loop = asyncio.get_running_loop()
+        if cls._pool is not None and cls._pool_loop is loop:
+            return cls._pool
             
-            try:
-                cls._pool = await asyncpg.create_pool(
-                    host=DB_CONFIG["host"],
-                    port=DB_CONFIG["port"],
-                    user=DB_CONFIG["user"],
-                    password=DB_CONFIG["password"],
-                    database=DB_CONFIG["database"],
-                    min_size=5,
-                    max_size=20
+        # The pool and its lock and semaphore only work on the loop that
+        # created them. Callers that start a new loop per task (asyncio.run
+        # in each Celery task, for instance) get a fresh set; the old loop is
+        # usually closed already, so its pool cannot be closed cleanly
+        if cls._pool_loop is not loop:
+            if cls._pool is not None:
+                logger.info("Event loop changed, creating a new connection pool")
+            cls._pool = None
+            cls._pool_lock = None
+            cls._checkout_sem = None
+            cls._stmt_cache.clear()
+            cls._search_paths.clear()
+            cls._pool_loop = loop
+            
+        # Serialize cold-start pool creation so concurrent callers share one pool
+        if cls._pool_lock is None:
+            cls._pool_lock = asyncio.Lock()
+            
+        async with cls._pool_lock:
+            if cls._pool is None:
+                logger.info("Initializing asyncpg database connection pool")
+                logger.info("Using database configuration: %r", {**DB_CONFIG, "password": "***"})
+                
+                # A configured default search_path is applied at connection startup,
+                # so queries against that schema never need a separate SET
+                server_settings = {}
+                if DB_CONFIG.get("search_path"):
+                    server_settings["search_path"] = DB_CONFIG["search_path"]
+                # 'force_custom_plan' stops cached statements settling on a generic
+                # plan that is poor for skewed parameter values
+                if DB_CONFIG.get("plan_cache_mode"):
+                    server_settings["plan_cache_mode"] = DB_CONFIG["plan_cache_mode"]
+                
+                pool_settings = _pool_settings()
+                logger.info(
+                    "Pool sizing: min_size=%s, max_size=%s, max_queries=%s, statement_cache_size=%s",
+                    pool_settings["min_size"],
+                    pool_settings["max_size"],
+                    pool_settings["max_queries"],
+                    pool_settings["statement_cache_size"]
                 )
-                logger.info("Database connection pool initialized")
-            except Exception as e:
-                logger.error(f"Failed to create connection pool: {str(e)}")
-                raise ConnectionError(f"Failed to create connection pool: {str(e)}") from e
                 
+                try:
+                    cls._pool = await asyncpg.create_pool(
+                        host=DB_CONFIG["host"],
+                        port=DB_CONFIG["port"],
+                        user=DB_CONFIG["user"],
+                        password=DB_CONFIG["password"],
+                        database=DB_CONFIG["database"],
+                        server_settings=server_settings or None,
+                        init=cls._init_connection,
+                        setup=cls._on_acquire,
+                        **pool_settings
+                    )
+                    # Bursts beyond twice the pool size wait here, not on the server
+                    cls._checkout_sem = asyncio.Semaphore(pool_settings["max_size"] * 2)
+                    logger.info("Database connection pool initialized")
+                except Exception as e:
+                    logger.error("Failed to create connection pool: %s", e)
+                    raise ConnectionError(f"Failed to create connection pool: {str(e)}") from e
+            
         return cls._pool
     
+    @staticmethod
+    def install_uvloop() -> bool:
+        """
+        Switch asyncio to the uvloop event loop, if it is available.
+        
+        This must be called before the event loop is started (for example
+        before ``asyncio.run``). It is opt-in rather than done at import time
+        so importing this module never changes the process-wide loop policy.
+        Set DB_CONFIG['use_uvloop'] to False to disable it.
+        
+        Returns:
+            True if uvloop was installed, False otherwise
+        """
+        if sys.platform == "win32" or not DB_CONFIG.get("use_uvloop", True):
+            return False
+            
+        try:
+            import uvloop
+        except ImportError:
+            logger.debug("uvloop is not installed, keeping the default asyncio event loop")
+            return False
+            
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("Installed uvloop event loop policy")
+        return True
+    
+    @classmethod
+    def register_warmup_query(cls, query: str) -> None:
+        """
+        Register a query to be prepared on every new pooled connection.
+        
+        Warmed statements land in asyncpg's statement cache, so the first
+        request on a fresh connection skips the Parse round trip. Queries
+        registered after the pool exists only apply to connections opened
+        from then on. DB_CONFIG['warmup_queries'] seeds the initial list.
+        
+        Args:
+            query: SQL query string, exactly as it will later be executed
+        """
+        if query not in cls._warmup_queries:
+            cls._warmup_queries.append(query)
+    
+    @classmethod
+    async def _init_connection(cls, conn) -> None:
+        """
+        Register type codecs and warm the statement cache on each new connection.
+        
+        json and jsonb columns are decoded straight into Python objects, so
+        callers no longer need to json.loads() fetched values. Warmup runs
+        after the codecs are registered because changing a codec drops the
+        connection's statement cache.
+        
+        Args:
+            conn: Newly opened connection
+        """
+        for type_name, (encoder, decoder) in _JSON_CODECS.items():
+            await conn.set_type_codec(
+                type_name,
+                encoder=encoder,
+                decoder=decoder,
+                schema="pg_catalog",
+                format="binary"
+            )
+            
+        if DB_CONFIG.get("pgbouncer", False):
+            return
+            
+        for query in cls._warmup_queries:
+            try:
+                await _prepare_statement(conn, query)
+            except asyncpg.PostgresError as e:
+                # A stale warmup query must not stop the pool from opening
+                logger.warning("Skipping warmup of query: %s", e)
+    
+    @classmethod
+    async def _on_acquire(cls, conn) -> None:
+        """
+        Reset per-connection state when a connection is checked out.
+        
+        asyncpg invalidates PreparedStatement objects once their connection is
+        released back to the pool, so the statement memo only lives for one
+        acquisition. The release also runs RESET ALL, which puts search_path
+        back to the connection default.
+        
+        Args:
+            conn: Pooled connection being handed out
+        """
+        raw = _raw_connection(conn)
+        cls._stmt_cache.pop(raw, None)
+        cls._search_paths[raw] = DB_CONFIG.get("search_path")
+    
+    @asynccontextmanager
+    async def _acquire(self):
+        """
+        Check a connection out of the pool, failing fast under overload.
+        
+        Both the wait for a checkout slot and the wait for a free connection
+        are bounded by DB_CONFIG['acquire_timeout'] (5 seconds by default,
+        None to wait forever).
+        
+        Yields:
+            asyncpg.Connection: Pooled connection
+            
+        Raises:
+            ConnectionError: If no connection becomes available in time
+        """
+        pool = await self.get_pool()
+        sem = self.__class__._checkout_sem
+        timeout = DB_CONFIG.get("acquire_timeout", 5)
+        
+        try:
+            if sem.locked():
+                await asyncio.wait_for(sem.acquire(), timeout)
+            else:
+                await sem.acquire()
+        except asyncio.TimeoutError as e:
+            raise ConnectionError(f"Timed out after {timeout}s waiting for a database connection") from e
+            
+        try:
+            try:
+                connection = await pool.acquire(timeout=timeout)
+            except asyncio.TimeoutError as e:
+                raise ConnectionError(f"Timed out after {timeout}s waiting for a database connection") from e
+            try:
+                yield connection
+            finally:
+                await pool.release(connection)
+        finally:
+            sem.release()
+    
+    async def _set_search_path(self, conn, schema: str) -> None:
+        """
+        Set the search_path on a connection unless it is already active.
+        
+        The schema is bound as a parameter of set_config(), so the statement
+        text is the same for every schema and is parsed only once.
+        
+        Args:
+            conn: Connection to configure
+            schema: Schema to put on the search_path
+            
+        Raises:
+            ValueError: If schema is not a plain identifier
+        """
+        raw = _raw_connection(conn)
+        if self._search_paths.get(raw) == schema:
+            return
+        if not _SCHEMA_NAME_RE.match(schema):
+            raise ValueError(f"Invalid schema name: {schema!r}")
+        await conn.execute("SELECT set_config('search_path', $1, false)", schema)
+        self._search_paths[raw] = schema
+    
+    async def _prepare_cached(self, conn, query: str) -> Tuple[Any, Tuple[str, ...]]:
+        """
+        Get a prepared statement for a query, preparing it on first use.
+        
+        Args:
+            conn: Connection to prepare the statement on
+            query: SQL query string
+            
+        Returns:
+            Tuple of (PreparedStatement, result column names)
+        """
+        stmts = self._stmt_cache.setdefault(_raw_connection(conn), {})
+        entry = stmts.get(query)
+        if entry is None:
+            stmt = await _prepare_statement(conn, query)
+            entry = (stmt, tuple(attr.name for attr in stmt.get_attributes()))
+            stmts[query] = entry
+        return entry
+    
+    async def _fetch(self, conn, method: str, query: str, args: tuple, cacheable: bool) -> Any:
+        """
+        Run a fetch method either through the statement cache or directly.
+        
+        Args:
+            conn: Connection to run the query on
+            method: Fetch method name ('fetchval', 'fetchrow' or 'fetch')
+            query: SQL query string
+            args: Query parameters
+            cacheable: Whether the prepared statement cache may be used
+            
+        Returns:
+            Result of the fetch method
+        """
+        if cacheable:
+            stmt, _ = await self._prepare_cached(conn, query)
+            return await getattr(stmt, method)(*args)
+        return await getattr(conn, method)(query, *args)
+    
+    async def _fetch_val(self, conn, query: str, args: tuple, cacheable: bool) -> Any:
+        """Fetch the first column of the first row."""
+        return await self._fetch(conn, "fetchval", query, args, cacheable)
+    
+    async def _fetch_row_dict(self, conn, query: str, args: tuple, cacheable: bool) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a single row as a dictionary.
+        
+        Cached statements reuse their column-name tuple instead of reading
+        the record's key map on every call.
+        """
+        if cacheable:
+            stmt, columns = await self._prepare_cached(conn, query)
+            row = await stmt.fetchrow(*args)
+            return dict(zip(columns, row)) if row is not None else None
+        row = await conn.fetchrow(query, *args)
+        return dict(row) if row else None
+    
+    async def _fetch_all_dicts(self, conn, query: str, args: tuple, cacheable: bool) -> List[Dict[str, Any]]:
+        """
+        Fetch all rows as dictionaries.
+        
+        Cached statements reuse their column-name tuple instead of reading
+        the record's key map on every row.
+        """
+        if cacheable:
+            stmt, columns = await self._prepare_cached(conn, query)
+            return [dict(zip(columns, row)) for row in await stmt.fetch(*args)]
+        return list(map(dict, await conn.fetch(query, *args)))
+    
+    async def _execute_status(self, conn, query: str, args: tuple, cacheable: bool) -> str:
+        """Execute a statement and return its status string."""
+        return await conn.execute(query, *args)
+    
+    async def _execute_rowcount(self, conn, query: str, args: tuple, cacheable: bool) -> int:
+        """
+        Execute a statement and return the number of rows it affected.
+        
+        The count is the last field of the command tag ("DELETE 5",
+        "INSERT 0 5"); tags without one, such as DDL, count as 0.
+        """
+        status = await conn.execute(query, *args)
+        count = status.rpartition(" ")[2]
+        return int(count) if count.isdigit() else 0
+    
+    async def _fetch_row_record(self, conn, query: str, args: tuple, cacheable: bool) -> Optional[asyncpg.Record]:
+        """Fetch a single row as an asyncpg Record."""
+        return await self._fetch(conn, "fetchrow", query, args, cacheable)
+    
+    async def _fetch_all_records(self, conn, query: str, args: tuple, cacheable: bool) -> List[asyncpg.Record]:
+        """Fetch all rows as asyncpg Records."""
+        return await self._fetch(conn, "fetch", query, args, cacheable)
+    
+    # Handler per execute mode, looked up once per query instead of testing each flag
+    _DISPATCH = {
+        "val": _fetch_val,
+        "row": _fetch_row_dict,
+        "all": _fetch_all_dicts,
+        "exec": _execute_status,
+        "count": _execute_rowcount,
+    }
+    
+    # Same modes, but rows are returned as Records without copying into dicts
+    _RECORD_DISPATCH = {
+        **_DISPATCH,
+        "row": _fetch_row_record,
+        "all": _fetch_all_records,
+    }
+    
+    async def _execute_on(self, 
+                          conn, 
+                          query: str, 
+                          params: Optional[tuple], 
+                          mode: ExecuteMode, 
+                          schema: Optional[str],
+                          return_records: bool = False) -> Any:
+        """
+        Run a query on an already acquired connection.
+        
+        See execute() for the meaning of the arguments and the return value.
+        """
+        # Optionally set schema
+        if schema:
+            await self._set_search_path(conn, schema)
+        
+        # Prepared statements bind table OIDs at prepare time, so they are
+        # not reused across search_path changes or behind PgBouncer
+        cacheable = not schema and not DB_CONFIG.get("pgbouncer", False)
+        handler = (self._RECORD_DISPATCH if return_records else self._DISPATCH)[mode]
+        try:
+            return await handler(self, conn, query, params or (), cacheable)
+        except asyncpg.InvalidCachedStatementError:
+            # The table changed since the statement was prepared. Prepare it
+            # again, unless a transaction is open and has already been aborted.
+            if not cacheable or conn.is_in_transaction():
+                raise
+            await self.clear_statement_cache(conn)
+            return await handler(self, conn, query, params or (), cacheable)
+    
     async def execute(self, 
                      query: str, 
                      params: tuple = None, 
                      fetch_val: bool = False,
                      fetch_row: bool = False, 
                      fetch_all: bool = False, 
-                     schema: str = None) -> Any:
+                     schema: str = None,
+                     fetch_iter: bool = False,
+                     conn: Optional[Any] = None,
+                     mode: Optional[ExecuteMode] = None,
+                     return_records: bool = False) -> Any:
         """
         Execute a query with proper error handling.
         
+        ``mode`` selects the result shape directly ('val', 'row', 'all', 'exec'
+        or 'count'); when it is omitted the fetch_* flags are used instead.
+        
+        With ``return_records`` rows come back as asyncpg Records, which
+        support lookup by column name, instead of being copied into dicts.
+        This suits hot read paths that only touch a few columns of many rows.
+        
+        Passing ``conn`` runs the query on a connection the caller already holds
+        (for example the one injected by with_db_connection), which skips the
+        pool checkout and keeps that connection's prepared statements warm.
+        
         Args:
             query: SQL query string
             params: Query parameters (values for $1, $2, etc.)
@@ -111,49 +634,286 @@ class DBConnector:
             fetch_row: Return single row as dictionary
             fetch_all: Return all rows as list of dictionaries
             schema: Schema to set before query
+            fetch_iter: Return an async iterator streaming rows as dictionaries
+            conn: Optional connection (or ConnectionWrapper) to run the query on
+            mode: Result shape, overriding the fetch_* flags
+            return_records: Return rows as asyncpg Records instead of dicts
             
         Returns:
             Query result based on fetch parameters:
             - fetch_val: Single value
-            - fetch_row: Single row as dictionary
-            - fetch_all: List of dictionaries
+            - fetch_row: Single row as dictionary (Record with return_records)
+            - fetch_all: List of dictionaries (Records with return_records)
+            - fetch_iter: Async iterator of dictionaries (see iterate())
+            - mode='count': Number of affected rows
             - default: Query status string
             
         Raises:
+            ValueError: If mode is not a known execute mode
             QueryError: If the query execution fails
             ConnectionError: If the connection cannot be acquired
         """
-        pool = await self.get_pool()
+        if fetch_iter:
+            return self.iterate(query, params, schema=schema)
+            
+        if mode is None:
+            mode = "val" if fetch_val else "row" if fetch_row else "all" if fetch_all else "exec"
+            
+        return await self.execute_mode(query, params, mode, schema, conn, return_records)
+    
+    async def execute_mode(self, 
+                           query: str, 
+                           params: Optional[tuple], 
+                           mode: ExecuteMode, 
+                           schema: Optional[str] = None,
+                           conn: Optional[Any] = None,
+                           return_records: bool = False) -> Any:
+        """
+        Execute a query for an explicit result shape.
         
+        This is execute() without the fetch_* flag handling, for hot paths
+        that know their result shape up front.
+        
+        Args:
+            query: SQL query string
+            params: Query parameters (values for $1, $2, etc.)
+            mode: Result shape: 'val', 'row', 'all', 'exec' or 'count'
+            schema: Schema to set before query
+            conn: Optional connection (or ConnectionWrapper) to run the query on
+            return_records: Return rows as asyncpg Records instead of dicts
+            
+        Returns:
+            Query result for the mode, as described in execute()
+            
+        Raises:
+            ValueError: If mode is not a known execute mode
+            QueryError: If the query execution fails
+            ConnectionError: If the connection cannot be acquired
+        """
+        if mode not in self._DISPATCH:
+            raise ValueError(f"Invalid execute mode: {mode}")
+            
         try:
-            async with pool.acquire() as conn:
-                # Optionally set schema
-                if schema:
-                    await conn.execute(f"SET search_path TO {schema}")
+            if conn is not None:
+                if isinstance(conn, ConnectionWrapper):
+                    conn = conn.connection
+                return await self._execute_on(conn, query, params, mode, schema, return_records)
                 
-                if fetch_val:
-                    return await conn.fetchval(query, *(params or ()))
-                elif fetch_row:
-                    row = await conn.fetchrow(query, *(params or ()))
-                    return dict(row) if row else None
-                elif fetch_all:
-                    rows = await conn.fetch(query, *(params or ()))
-                    return [dict(row) for row in rows] if rows else []
-                else:
-                    return await conn.execute(query, *(params or ()))
+            async with self._acquire() as pooled_conn:
+                return await self._execute_on(pooled_conn, query, params, mode, schema, return_records)
         except asyncpg.PostgresError as e:
-            logger.error(f"Database query error: {str(e)}")
-            logger.error(f"Query: {query}")
+            logger.error("Database query error: %s", e)
+            logger.error("Query: %s", query)
             if params:
-                logger.error(f"Params: {params}")
+                logger.error("Params: %s", params)
             raise QueryError(f"Database query error: {str(e)}") from e
         except Exception as e:
-            logger.error(f"Unexpected error during query execution: {str(e)}")
-            logger.error(f"Query: {query}")
+            logger.error("Unexpected error during query execution: %s", e)
+            logger.error("Query: %s", query)
             if params:
-                logger.error(f"Params: {params}")
+                logger.error("Params: %s", params)
             raise
     
+    async def execute_many(self, 
+                           query: str, 
+                           param_rows: Sequence[tuple], 
+                           schema: str = None) -> None:
+        """
+        Execute one statement for many parameter sets in a single batch.
+        
+        The statement is parsed once and all Bind/Execute messages are sent
+        together, so N rows cost one round-trip instead of N.
+        
+        Args:
+            query: SQL query string
+            param_rows: Sequence of parameter tuples, one per execution
+            schema: Schema to set before query
+            
+        Raises:
+            QueryError: If the query execution fails (no rows are applied)
+        """
+        if not param_rows:
+            return
+            
+        try:
+            async with self._acquire() as conn:
+                if schema:
+                    await self._set_search_path(conn, schema)
+                    
+                async with conn.transaction():
+                    await conn.executemany(query, param_rows)
+        except asyncpg.PostgresError as e:
+            logger.error("Database query error: %s", e)
+            logger.error("Query: %s", query)
+            logger.error("Param rows: %s", len(param_rows))
+            raise QueryError(f"Database query error: {str(e)}") from e
+    
+    async def copy_records(self, 
+                           table: str, 
+                           records: Sequence[tuple], 
+                           columns: Sequence[str], 
+                           schema: str = "public") -> str:
+        """
+        Bulk load rows into a table with the COPY protocol.
+        
+        COPY streams rows in binary without per-row Bind/Execute messages,
+        which makes it the fastest way to load large batches.
+        
+        Args:
+            table: Table name
+            records: Sequence of row tuples, ordered like columns
+            columns: Column names to load
+            schema: Schema containing the table
+            
+        Returns:
+            COPY status string, e.g. "COPY 500"
+            
+        Raises:
+            QueryError: If the copy fails (no rows are applied)
+        """
+        try:
+            async with self._acquire() as conn:
+                return await conn.copy_records_to_table(
+                    table,
+                    records=records,
+                    columns=list(columns),
+                    schema_name=schema
+                )
+        except asyncpg.PostgresError as e:
+            logger.error("Database copy error: %s", e)
+            logger.error("Table: %s.%s", schema, table)
+            logger.error("Rows: %s", len(records))
+            raise QueryError(f"Database copy error: {str(e)}") from e
+    
+    async def copy_text(self, 
+                        table: str, 
+                        data: str, 
+                        columns: Optional[Sequence[str]] = None, 
+                        schema: Optional[str] = None) -> str:
+        """
+        Load COPY text-format data, as found in pg_dump scripts, into a table.
+        
+        Args:
+            table: Table name
+            data: Tab-separated rows, one per line, without the
+                terminating backslash-dot line
+            columns: Column names to load, or None for all columns
+            schema: Schema containing the table, or None to use the search path
+            
+        Returns:
+            COPY status string, e.g. "COPY 500"
+            
+        Raises:
+            QueryError: If the copy fails (no rows are applied)
+        """
+        try:
+            async with self._acquire() as conn:
+                return await conn.copy_to_table(
+                    table,
+                    source=io.BytesIO(data.encode("utf-8")),
+                    columns=list(columns) if columns else None,
+                    schema_name=schema,
+                    format="text"
+                )
+        except asyncpg.PostgresError as e:
+            logger.error("Database copy error: %s", e)
+            logger.error("Table: %s.%s", schema, table)
+            raise QueryError(f"Database copy error: {str(e)}") from e
+    
+    async def pipeline(self, 
+                       ops: List[Tuple[str, Optional[tuple], str]], 
+                       schema: str = None) -> List[Any]:
+        """
+        Run several queries on one connection inside a single transaction.
+        
+        Each operation is a ``(query, params, mode)`` tuple where mode is one of
+        'val', 'row', 'all', 'exec' or 'count', as for the mode argument of execute().
+        Sharing one connection avoids a pool checkout per query and lets
+        repeated queries reuse their prepared statement.
+        
+        Usage:
+            user, posts = await db.pipeline([
+                ("SELECT * FROM users WHERE id = $1", (user_id,), "row"),
+                ("SELECT * FROM posts WHERE user_id = $1", (user_id,), "all"),
+            ])
+        
+        Args:
+            ops: List of (query, params, mode) tuples
+            schema: Schema to set before the queries
+            
+        Returns:
+            List of results in the same order as ops
+            
+        Raises:
+            ValueError: If an operation has an unknown mode
+            QueryError: If any query fails (the whole batch is rolled back)
+        """
+        cacheable = not schema and not DB_CONFIG.get("pgbouncer", False)
+        results = []
+        query = None
+        
+        try:
+            async with self._acquire() as conn:
+                if schema:
+                    await self._set_search_path(conn, schema)
+                    
+                async with conn.transaction():
+                    for query, params, mode in ops:
+                        handler = self._DISPATCH.get(mode)
+                        if handler is None:
+                            raise ValueError(f"Invalid pipeline mode: {mode}")
+                        results.append(await handler(self, conn, query, params or (), cacheable))
+        except asyncpg.PostgresError as e:
+            logger.error("Database query error: %s", e)
+            logger.error("Query: %s", query)
+            raise QueryError(f"Database query error: {str(e)}") from e
+            
+        return results
+    
+    async def iterate(self, 
+                      query: str, 
+                      params: tuple = None, 
+                      schema: str = None,
+                      prefetch: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream query results through a server-side cursor.
+        
+        Rows are fetched from the server in batches of ``prefetch`` so large
+        result sets never have to be held in memory at once. The connection
+        stays checked out until the iteration finishes.
+        
+        Usage:
+            async for row in db.iterate("SELECT * FROM items"):
+                ...
+        
+        Args:
+            query: SQL query string
+            params: Query parameters (values for $1, $2, etc.)
+            schema: Schema to set before query
+            prefetch: Number of rows fetched per round-trip
+            
+        Yields:
+            Dict[str, Any]: Each row as a dictionary
+            
+        Raises:
+            QueryError: If the query execution fails
+        """
+        try:
+            async with self._acquire() as conn:
+                if schema:
+                    await self._set_search_path(conn, schema)
+                    
+                # Cursors only exist inside a transaction
+                async with conn.transaction():
+                    async for row in conn.cursor(query, *(params or ()), prefetch=prefetch):
+                        yield dict(row)
+        except asyncpg.PostgresError as e:
+            logger.error("Database query error: %s", e)
+            logger.error("Query: %s", query)
+            if params:
+                logger.error("Params: %s", params)
+            raise QueryError(f"Database query error: {str(e)}") from e
+    
     @asynccontextmanager
     async def transaction(self):
         """
@@ -167,74 +927,45 @@ class DBConnector:
             asyncpg.Connection: Connection with active transaction
             
         Raises:
+            ConnectionError: If no connection becomes available in time
             TransactionError: If transaction operations fail
         """
-        pool = await self.get_pool()
-        connection = await pool.acquire()
-        transaction = None
-        
-        try:
-            transaction = connection.transaction()
-            await transaction.start()
+        async with self._acquire() as connection:
+            transaction = None
             
-            # Create method for dictionary query results without modifying connection object
-            async def fetch_dict(query, *args):
-                row = await connection.fetchrow(query, *args)
-                return dict(row) if row else None
+            try:
+                transaction = connection.transaction()
+                await transaction.start()
                 
-            async def fetch_all_dict(query, *args):
-                rows = await connection.fetch(query, *args)
-                return [dict(row) for row in rows] if rows else []
-            
-            # Instead of adding these methods to the connection directly, create a wrapper
-            class ConnectionWrapper:
-                def __init__(self, connection):
-                    self.connection = connection
-                    
-                async def execute(self, query, *args):
-                    # If args[0] is a tuple and it's the only arg, we need to unpack it
-                    if len(args) == 1 and isinstance(args[0], tuple):
-                        return await connection.execute(query, *args[0])
-                    return await connection.execute(query, *args)
-                    
-                async def fetchval(self, query, *args):
-                    if len(args) == 1 and isinstance(args[0], tuple):
-                        return await connection.fetchval(query, *args[0])
-                    return await connection.fetchval(query, *args)
-                    
-                async def fetchrow(self, query, *args):
-                    if len(args) == 1 and isinstance(args[0], tuple):
-                        return await connection.fetchrow(query, *args[0])
-                    return await connection.fetchrow(query, *args)
-                    
-                async def fetch(self, query, *args):
-                    if len(args) == 1 and isinstance(args[0], tuple):
-                        return await connection.fetch(query, *args[0])
-                    return await connection.fetch(query, *args)
-                    
-                async def fetch_dict(self, query, *args):
-                    if len(args) == 1 and isinstance(args[0], tuple):
-                        return await fetch_dict(query, *args[0])
-                    return await fetch_dict(query, *args)
-                    
-                async def fetch_all_dict(self, query, *args):
-                    if len(args) == 1 and isinstance(args[0], tuple):
-                        return await fetch_all_dict(query, *args[0])
-                    return await fetch_all_dict(query, *args)
-                    
-            # Yield the wrapped connection
-            yield ConnectionWrapper(connection)
-            await transaction.commit()
-        except Exception as e:
-            if transaction:
-                try:
-                    await transaction.rollback()
-                except Exception as rb_error:
-                    logger.error(f"Error rolling back transaction: {str(rb_error)}")
-            logger.error(f"Transaction error: {str(e)}")
-            raise TransactionError(f"Transaction error: {str(e)}") from e
-        finally:
-            await pool.release(connection)
+                # Yield the wrapped connection
+                yield ConnectionWrapper(connection)
+                await transaction.commit()
+            except Exception as e:
+                if transaction:
+                    try:
+                        await transaction.rollback()
+                    except Exception as rb_error:
+                        logger.error("Error rolling back transaction: %s", rb_error)
+                logger.error("Transaction error: %s", e)
+                raise TransactionError(f"Transaction error: {str(e)}") from e
+    
+    async def clear_statement_cache(self, conn=None) -> None:
+        """
+        Drop cached statements and type information after schema changes.
+        
+        Call this after migrations or other DDL so no connection keeps using a
+        plan built against the old table definitions.
+        
+        Args:
+            conn: Connection to clear. If None, every pooled connection is
+                  expired and reconnects with empty caches on next use.
+        """
+        if conn is not None:
+            self._stmt_cache.pop(_raw_connection(conn), None)
+            await conn.reload_schema_state()
+        elif self.__class__._pool is not None:
+            self._stmt_cache.clear()
+            await self.__class__._pool.expire_connections()
     
     async def close(self):
         """
@@ -245,22 +976,8 @@ class DBConnector:
         if self.__class__._pool:
             await self.__class__._pool.close()
             self.__class__._pool = None
+            # The lock belongs to the closing event loop; a new pool gets a new lock
+            self.__class__._pool_lock = None
+            self.__class__._checkout_sem = None
+            self.__class__._pool_loop = None
             logger.info("Database connection pool closed")
-
-
-# Exception classes
-class ConnectionError(Exception):
-    """Error connecting to the database."""
-    pass
-
-class QueryError(Exception):
-    """Error executing a database query."""
-    pass
-
-class TransactionError(Exception):
-    """Error with database transactions."""
-    pass
-
-class SchemaError(Exception):
-    """Error with database schema operations."""
-    pass 
\ No newline at end of file
@@ -26,13 +26,18 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar('T')  # Return type of the decorated function
 
+# DBConnector keeps its pool at class level, so one module-wide instance
+# serves every decorated call without opening or closing a pool per call
+_connector = DBConnector()
+
 def with_db_connection(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
     """
     Async decorator that provides a database connection to a coroutine function.
     
     This decorator:
     1. Automatically acquires a database connection from the pool
-    2. Manages the connection lifecycle (release back to pool)
+    2. Manages the connection lifecycle (release back to the shared pool,
+       which stays open across calls)
     3. Provides transaction support (commit on success, rollback on failure)
     4. Works with both instance methods and standalone functions
     
@@ -40,13 +45,22 @@ def with_db_connection(func: Callable[..., Awaitable[T]]) -> Callable[..., Await
         @with_db_connection
         async def my_db_function(conn, arg1, arg2):
             # The conn parameter is injected by the decorator
-            result = await conn.execute("SELECT * FROM users WHERE id = $1", (arg1,))
+            result = await conn.execute("SELECT * FROM users WHERE id = $1", arg1)
             return result
             
         @with_db_connection
         async def my_method(self, conn, arg1):
             # Works with instance methods too
             return await conn.execute(...)
+            
+        @with_db_connection
+        async def my_handler(conn, user_id):
+            # Reuse the injected connection for DBConnector queries so the
+            # whole handler rides one checkout and one transaction
+            db = DBConnector()
+            user = await db.execute("SELECT * FROM users WHERE id = $1", (user_id,),
+                                    fetch_row=True, conn=conn)
+            ...
     
     Args:
         func: The async function to decorate
@@ -62,12 +76,9 @@ def with_db_connection(func: Callable[..., Awaitable[T]]) -> Callable[..., Await
         # Determine if this is a method call (instance method)
         is_method = args and not inspect.isclass(args[0]) and hasattr(args[0], func.__name__)
         
-        # Create the connector and get a connection
-        connector = DBConnector()
-        
         try:
             # Use the transaction context manager to handle connection lifecycle
-            async with connector.transaction() as conn:
+            async with _connector.transaction() as conn:
                 # Call the wrapped function with the connection as first argument
                 # For methods, self is args[0], so insert connection as second arg
                 if is_method:
@@ -79,8 +90,5 @@ def with_db_connection(func: Callable[..., Awaitable[T]]) -> Callable[..., Await
             # Log the error (transaction rollback is handled by the context manager)
             logger.error(f"Database error in {func.__name__}: {str(e)}")
             raise
-        finally:
-            # Close the connector to ensure proper cleanup
-            await connector.close()
     
     return wrapper 
\ No newline at end of file
@@ -3,97 +3,136 @@
 Script to extract all object_models from SQL dump file and create INSERT statements
 """
 
-import re
-import os
+import mmap
+import multiprocessing
+import sys
 import json
+import re
+from pathlib import Path
 
-# Define paths
-DUMP_FILE = "services/database/docs/contentgen_test_db_localhost-2025_05_21_18_02_45-dump.sql"
-OUTPUT_FILE = "services/database/docs/object_models_inserts.sql"
+# Define paths; both can be overridden on the command line
+SQL_SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "sql_scripts"
+DUMP_FILE = SQL_SCRIPTS_DIR / "contentgen_test_db_localhost-2025_05_21_18_02_45-dump.sql"
+OUTPUT_FILE = SQL_SCRIPTS_DIR / "object_models_inserts.sql"
 
-def extract_object_models():
-    """Extract all object_models records from the SQL dump file"""
+# Markers of the object_models COPY section in the dump. The dump is read
+# as bytes so only the rows of this section are ever decoded
+COPY_HEADER = b"COPY public.object_models "
+COPY_HEADER_END = b"FROM stdin;"
+COPY_TERMINATOR = b"\\."
+
+# One INSERT per row, filled in with str.format
+INSERT_TEMPLATE = """INSERT INTO public.object_models (id, name, object_type, version, definition, description, use_cases, related_templates, created_at, updated_at)
+VALUES (
+  '{}',
+  '{}',
+  '{}',
+  '{}',
+  '{}',
+  '{}',
+  {},
+  '{}',
+  '{}',
+  '{}'
+);
+
+"""
+
+# One item of a Postgres array literal, as written: a double-quoted item
+# with its backslash escapes, or a bare item up to the next comma
+ARRAY_ITEM_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[^,]+')
+
+def format_row(row):
+    """Build the INSERT statement for one COPY row, or None if the row is malformed"""
     
-    # Check if dump file exists
-    if not os.path.exists(DUMP_FILE):
-        print(f"Error: Dump file {DUMP_FILE} not found")
-        return False
+    # Split the row by tabs
+    fields = row.decode('utf-8').split('\t')
+    if len(fields) < 10:
+        return None
     
-    # Read the entire dump file
-    with open(DUMP_FILE, 'r') as f:
-        content = f.read()
+    # Process use_cases array safely
+    use_cases = fields[6]
+    if use_cases.startswith('{') and use_cases.endswith('}'):
+        use_cases = use_cases[1:-1]  # Remove braces
+        # Split by commas, keeping each item exactly as written so quoted
+        # values (with commas, escapes or nothing inside) survive intact
+        use_cases_items = ARRAY_ITEM_RE.findall(use_cases)
+        
+        use_cases_sql = "ARRAY[" + ",".join(use_cases_items) + "]"
+    else:
+        use_cases_sql = "'{}'::text[]"
     
-    # Find the object_models COPY section
-    model_pattern = r"COPY public\.object_models.*?FROM stdin;\n(.*?)\\\.[\n\r]"
-    model_match = re.search(model_pattern, content, re.DOTALL)
+    # Create INSERT statement, escaping single quotes in the free-text fields
+    # (str.replace, not str.translate: a one-to-two char mapping puts translate
+    # on its slow path, several times slower even when there is no quote)
+    name, definition, description = (value.replace("'", "''") for value in (fields[1], fields[4], fields[5]))
+    return INSERT_TEMPLATE.format(
+        fields[0], name, fields[2], fields[3], definition, description, use_cases_sql, fields[7], fields[8], fields[9]
+    )
+
+def iter_rows(dump):
+    """Yield the rows of the COPY section that the dump is positioned in"""
+    for line in iter(dump.readline, b""):
+        # The COPY data ends at a line holding only "\."
+        row = line.rstrip(b'\r\n')
+        if row == COPY_TERMINATOR:
+            return
+        yield row
+
+def extract_object_models(dump_file=DUMP_FILE, output_file=OUTPUT_FILE):
+    """Extract all object_models records from the SQL dump file"""
     
-    if not model_match:
-        print("Error: Could not find object_models data section")
+    # Check if dump file exists
+    if not dump_file.exists():
+        print(f"Error: Dump file {dump_file} not found")
         return False
     
-    # Extract the data rows
-    data_section = model_match.group(1).strip()
-    rows = data_section.split('\n')
-    
-    print(f"Found {len(rows)} object_models records")
+    count = 0
     
-    # Generate INSERT statements
-    with open(OUTPUT_FILE, 'w') as f:
-        f.write("-- Generated INSERT statements for object_models\n\n")
+    # Map the dump instead of reading it; it can be hundreds of MB and only
+    # the object_models section is ever copied into Python objects
+    with open(dump_file, 'rb') as dump_fh, mmap.mmap(dump_fh.fileno(), 0, access=mmap.ACCESS_READ) as dump:
+        # Skip ahead to the object_models COPY section. Plain string checks
+        # keep this linear; the trailing space rules out tables that merely
+        # share the prefix, such as object_models_archive
+        pos = dump.find(COPY_HEADER)
+        while pos != -1:
+            line_end = dump.find(b"\n", pos)
+            if line_end == -1:
+                line_end = len(dump)
+            if (pos == 0 or dump[pos - 1] == ord("\n")) and dump[pos:line_end].rstrip().endswith(COPY_HEADER_END):
+                break
+            pos = dump.find(COPY_HEADER, line_end)
+        else:
+            print("Error: Could not find object_models data section")
+            return False
+        dump.seek(line_end + 1)
         
-        for row in rows:
-            # Split the row by tabs
-            fields = row.split('\t')
-            if len(fields) < 10:
-                print(f"Warning: Invalid row format, skipping")
-                continue
+        # Generate INSERT statements
+        with open(output_file, 'w', buffering=1 << 20) as f:
+            f.write("-- Generated INSERT statements for object_models\n\n")
+            buffer = []
             
-            # Process use_cases array safely
-            use_cases = fields[6]
-            if use_cases.startswith('{') and use_cases.endswith('}'):
-                use_cases = use_cases[1:-1]  # Remove braces
-                # Split by commas, but handle quoted values with commas inside
-                use_cases_items = []
-                in_quotes = False
-                current_item = ""
-                
-                for char in use_cases:
-                    if char == '"' and (len(current_item) == 0 or current_item[-1] != '\\'):
-                        in_quotes = not in_quotes
-                        current_item += char
-                    elif char == ',' and not in_quotes:
-                        if current_item:
-                            use_cases_items.append(current_item)
-                        current_item = ""
-                    else:
-                        current_item += char
-                
-                if current_item:
-                    use_cases_items.append(current_item)
-                
-                use_cases_sql = "ARRAY[" + ",".join(use_cases_items) + "]"
-            else:
-                use_cases_sql = "'{}'::text[]"
+            # Each row is independent, so format them in worker processes;
+            # imap hands the statements back in dump order
+            with multiprocessing.Pool() as pool:
+                for insert in pool.imap(format_row, iter_rows(dump), chunksize=1024):
+                    count += 1
+                    if insert is None:
+                        print(f"Warning: Invalid row format, skipping")
+                        continue
+                    
+                    # Write in batches rather than once per row
+                    buffer.append(insert)
+                    if len(buffer) >= 1024:
+                        f.writelines(buffer)
+                        buffer.clear()
             
-            # Create INSERT statement
-            insert = f"""INSERT INTO public.object_models (id, name, object_type, version, definition, description, use_cases, related_templates, created_at, updated_at)
-VALUES (
-  '{fields[0]}',
-  '{fields[1].replace("'", "''")}',
-  '{fields[2]}',
-  '{fields[3]}',
-  '{fields[4].replace("'", "''")}',
-  '{fields[5].replace("'", "''")}',
-  {use_cases_sql},
-  '{fields[7]}',
-  '{fields[8]}',
-  '{fields[9]}'
-);
-"""
-            f.write(insert + "\n")
+            f.writelines(buffer)
     
-    print(f"Successfully wrote INSERT statements to {OUTPUT_FILE}")
+    print(f"Found {count} object_models records")
+    print(f"Successfully wrote INSERT statements to {output_file}")
     return True
 
 if __name__ == "__main__":
-    extract_object_models() 
\ No newline at end of file
+    extract_object_models(*(Path(arg) for arg in sys.argv[1:3])) 
\ No newline at end of file
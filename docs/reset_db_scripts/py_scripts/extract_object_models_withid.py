@@ -55,21 +55,23 @@ def extract_object_models():
                 # Split by commas, but handle quoted values with commas inside
                 use_cases_items = []
                 in_quotes = False
-                current_item = ""
+                # Collect characters in a list; growing a str one char at a
+                # time can copy it on every append
+                current_item = []
                 
                 for char in use_cases:
                     if char == '"' and (len(current_item) == 0 or current_item[-1] != '\\'):
                         in_quotes = not in_quotes
-                        current_item += char
+                        current_item.append(char)
                     elif char == ',' and not in_quotes:
                         if current_item:
-                            use_cases_items.append(current_item)
-                        current_item = ""
+                            use_cases_items.append("".join(current_item))
+                        current_item = []
                     else:
-                        current_item += char
+                        current_item.append(char)
                 
                 if current_item:
-                    use_cases_items.append(current_item)
+                    use_cases_items.append("".join(current_item))
                 
                 use_cases_sql = "ARRAY[" + ",".join(use_cases_items) + "]"
             else:
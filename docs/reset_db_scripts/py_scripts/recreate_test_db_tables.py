@@ -22,6 +22,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Verification queries. asyncpg prepares each statement on first use and
+# caches it per connection, so fixed query text is all reuse needs
+TABLES_QUERY = """
+    SELECT table_name 
+    FROM information_schema.tables 
+    WHERE table_schema = 'public' AND table_type = 'BASE TABLE'
+    ORDER BY table_name
+"""
+OBJECT_MODELS_QUERY = "SELECT id, name, object_type, version FROM public.object_models"
+PROJECTS_QUERY = "SELECT id, name, schema_name, primary_language, status FROM public.projects"
+PROMPTS_QUERY = "SELECT id, name, engine_type, template_type, version, is_active FROM public.prompts"
+
 async def recreate_tables():
     """Recreate and populate the tables in the test database using e2e mode."""
     try:
@@ -37,45 +49,43 @@ async def recreate_tables():
         logger.info(f"Connected to database: {db_info['current_database']} as user: {db_info['current_user']}")
         
         # SQL file path
-        sql_file_path = os.path.join(os.path.dirname(__file__), "clean_public_schema.sql")
-        
-        # Read the SQL file
-        logger.info(f"Reading SQL file: {sql_file_path}")
-        with open(sql_file_path, 'r') as f:
-            sql_script = f.read()
+        sql_file_path = os.path.join(os.path.dirname(__file__), "..", "sql_scripts", "clean_public_schema.sql")
         
-        # Execute the SQL script using the new run_sql_script method
-        logger.info("Executing SQL script using run_sql_script...")
-        await db.run_sql_script(sql_script, script_name="clean_public_schema.sql")
+        # Stream the SQL script, executing each statement as it is read
+        logger.info(f"Executing SQL file using run_sql_file: {sql_file_path}")
+        await db.run_sql_file(sql_file_path, script_name="clean_public_schema.sql")
         
         # Verify the tables were created
         logger.info("Verifying tables were created...")
-        tables = await db.execute("""
-            SELECT table_name 
-            FROM information_schema.tables 
-            WHERE table_schema = 'public' AND table_type = 'BASE TABLE'
-            ORDER BY table_name
-        """, fetch_all=True)
+        # The checks are independent and each execute() takes its own pooled
+        # connection, so run them concurrently
+        tables, object_models, projects, prompts = await asyncio.gather(
+            db.execute(TABLES_QUERY, fetch_all=True),
+            db.execute(OBJECT_MODELS_QUERY, fetch_all=True),
+            db.execute(PROJECTS_QUERY, fetch_all=True),
+            db.execute(PROMPTS_QUERY, fetch_all=True)
+        )
         
-        logger.info("Tables in public schema:")
-        for table in tables:
-            logger.info(f"  - {table['table_name']}")
+        # One log record per listing rather than one per row
+        logger.info("Tables in public schema:\n" + "\n".join(
+            f"  - {table['table_name']}" for table in tables
+        ))
         
-        # Check data in each table
-        logger.info("\nVerifying data in object_models table:")
-        object_models = await db.execute("SELECT id, name, object_type, version FROM public.object_models", fetch_all=True)
-        for model in object_models:
-            logger.info(f"  - {model['name']} ({model['object_type']}, v{model['version']})")
+        # Show the data in each table
+        logger.info("\nVerifying data in object_models table:\n" + "\n".join(
+            f"  - {model['name']} ({model['object_type']}, v{model['version']})"
+            for model in object_models
+        ))
         
-        logger.info("\nVerifying data in projects table:")
-        projects = await db.execute("SELECT id, name, schema_name, primary_language, status FROM public.projects", fetch_all=True)
-        for project in projects:
-            logger.info(f"  - {project['name']} (schema: {project['schema_name']}, status: {project['status']})")
+        logger.info("\nVerifying data in projects table:\n" + "\n".join(
+            f"  - {project['name']} (schema: {project['schema_name']}, status: {project['status']})"
+            for project in projects
+        ))
         
-        logger.info("\nVerifying data in prompts table:")
-        prompts = await db.execute("SELECT id, name, engine_type, template_type, version, is_active FROM public.prompts", fetch_all=True)
-        for prompt in prompts:
-            logger.info(f"  - {prompt['name']} (engine: {prompt['engine_type']}, type: {prompt['template_type']}, active: {prompt['is_active']})")
+        logger.info("\nVerifying data in prompts table:\n" + "\n".join(
+            f"  - {prompt['name']} (engine: {prompt['engine_type']}, type: {prompt['template_type']}, active: {prompt['is_active']})"
+            for prompt in prompts
+        ))
         
         logger.info("\nTables recreated and populated successfully in test database!")
         
@@ -44,58 +44,50 @@ async def process_user_data(conn, user_id: str, data: Dict[str, Any]) -> Dict[st
     Returns:
         Processed user data with status
     """
-    # Check if user exists
-    user = await conn.fetch_dict(
-        "SELECT * FROM public.users WHERE id = $1",
-        user_id
-    )
-    
-    if not user:
-        logger.error(f"User {user_id} not found")
-        return {"status": "error", "message": "User not found"}
-    
-    # Update user data
-    updated_user = await conn.execute(
+    # Update user data and log the update in one statement; no row comes
+    # back if the user does not exist, so no separate existence check
+    updated_id = await conn.fetchval(
         """
-        UPDATE public.users 
-        SET 
-            name = $1,
-            email = $2,
-            updated_at = NOW()
-        WHERE id = $3
-        RETURNING *
+        WITH updated AS (
+            UPDATE public.users 
+            SET 
+                name = $1,
+                email = $2,
+                updated_at = NOW()
+            WHERE id = $3
+            RETURNING id
+        ), audit AS (
+            INSERT INTO public.audit_logs (entity_type, entity_id, action, data)
+            SELECT 'user', id, 'update', $4::jsonb
+            FROM updated
+        )
+        SELECT id FROM updated
         """,
         data.get("name"),
         data.get("email"),
-        user_id
-    )
-    
-    # Create user preferences
-    if "preferences" in data:
-        for pref_key, pref_value in data["preferences"].items():
-            await conn.execute(
-                """
-                INSERT INTO public.user_preferences (user_id, key, value)
-                VALUES ($1, $2, $3)
-                ON CONFLICT (user_id, key) DO UPDATE SET value = $3
-                """,
-                user_id,
-                pref_key,
-                pref_value
-            )
-    
-    # Log the update
-    await conn.execute(
-        """
-        INSERT INTO public.audit_logs (entity_type, entity_id, action, data)
-        VALUES ($1, $2, $3, $4)
-        """,
-        "user",
         user_id,
-        "update",
         {"updated_fields": list(data.keys())}
     )
     
+    if updated_id is None:
+        logger.error(f"User {user_id} not found")
+        return {"status": "error", "message": "User not found"}
+    
+    # Create user preferences, all in one statement
+    if data.get("preferences"):
+        pref_keys, pref_values = zip(*data["preferences"].items())
+        await conn.execute(
+            """
+            INSERT INTO public.user_preferences (user_id, key, value)
+            SELECT $1::uuid, t.key, t.value
+            FROM unnest($2::text[], $3::text[]) AS t(key, value)
+            ON CONFLICT (user_id, key) DO UPDATE SET value = EXCLUDED.value
+            """,
+            user_id,
+            list(pref_keys),
+            list(pref_values)
+        )
+    
     return {
         "status": "success",
         "user_id": user_id,
@@ -120,47 +112,41 @@ async def update_multiple_records(conn, record_ids: List[str], update_data: Dict
     Returns:
         Status of the update operation
     """
-    updated_count = 0
-    failed_ids = []
-    
     # Transaction is handled by the decorator
-    # If any operation fails, all updates will be rolled back
+    # If the update fails, it will be rolled back
+    
+    try:
+        # Update all records in one round-trip
+        updated = await conn.fetch(
+            """
+            UPDATE public.records
+            SET 
+                status = $1,
+                metadata = metadata || $2::jsonb,
+                updated_at = NOW()
+            WHERE id = ANY($3::uuid[])
+            RETURNING id
+            """,
+            update_data.get("status"),
+            update_data.get("metadata", {}),
+            record_ids
+        )
+    except Exception as e:
+        # This exception will be caught by the decorator
+        # The transaction will be rolled back automatically
+        logger.error(f"Error updating records {record_ids}: {str(e)}")
+        # Re-raise to trigger rollback
+        raise
     
-    for record_id in record_ids:
-        try:
-            # Update the record
-            result = await conn.execute(
-                """
-                UPDATE public.records
-                SET 
-                    status = $1,
-                    metadata = metadata || $2::jsonb,
-                    updated_at = NOW()
-                WHERE id = $3
-                RETURNING id
-                """,
-                update_data.get("status"),
-                update_data.get("metadata", {}),
-                record_id
-            )
-            
-            if result:
-                updated_count += 1
-            else:
-                failed_ids.append(record_id)
-                
-        except Exception as e:
-            # This exception will be caught by the decorator
-            # The transaction will be rolled back automatically
-            logger.error(f"Error updating record {record_id}: {str(e)}")
-            # Re-raise to trigger rollback
-            raise
+    # Records missing from the RETURNING rows did not exist
+    updated_ids = {str(row["id"]) for row in updated}
+    failed_ids = [record_id for record_id in record_ids if str(record_id) not in updated_ids]
     
     # If we get here, all updates succeeded and the transaction will be committed
     
     return {
         "status": "success",
-        "updated_count": updated_count,
+        "updated_count": len(updated),
         "total_records": len(record_ids),
         "failed_ids": failed_ids
     } 
\ No newline at end of file
@@ -11,6 +11,7 @@ FUNCTIONS:
 DEPENDENCIES:
     - services.database: For database operations
     - functools: For decorator utilities
+    - orjson: Optional faster JSON output
 
 This module provides practical examples of using the DBOperator with different
 test modes: production, e2e (end-to-end), and mock. It demonstrates how to
@@ -25,14 +26,30 @@ python services/database/examples/db_operator_test_modes.py
 import json
 import sys
 from typing import Dict, Any, List, Optional, Callable
-from functools import wraps
+from functools import lru_cache, wraps
 
 # Import database components
 from services.database import DBOperator, SchemaRegistry
 
+# orjson is optional; it formats the demo output much faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def pretty_print(data: Any) -> None:
     """Pretty print data as JSON."""
-    print(json.dumps(data, indent=2, default=str))
+    if orjson is not None:
+        print(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode())
+    else:
+        print(json.dumps(data, indent=2, default=str))
+
+@lru_cache(maxsize=None)
+def _get_mock_registry() -> SchemaRegistry:
+    """Build and initialize the mock schema registry once per process."""
+    registry = SchemaRegistry()
+    registry.initialize()
+    return registry
 
 def db_operation(mode: Optional[str] = None):
     """
@@ -50,11 +67,10 @@ def db_operation(mode: Optional[str] = None):
             # Create the appropriate DBOperator based on the mode
             db = DBOperator(test_mode=mode)
             
-            # If using mock mode, set up mock data
+            # If using mock mode, set up mock data (the registry is shared
+            # across calls rather than reloaded each time)
             if mode == 'mock':
-                registry = SchemaRegistry()
-                registry.initialize()
-                db.schema_registry = registry
+                db.schema_registry = _get_mock_registry()
                 
             # Pass the DBOperator to the function
             return func(db, *args, **kwargs)
@@ -104,27 +120,34 @@ def demo_e2e_mode(db: DBOperator) -> None:
     print("4. Should be used within transaction isolation when appropriate")
     
     print("\nExample query:")
-    schema_names = db.fetch_all("""
-        SELECT schema_name 
-        FROM information_schema.schemata 
-        WHERE schema_name LIKE 'prj\_%'
-    """)
-    
+    # One round trip for both listings: every project schema, joined to
+    # its tables only for the first schema. The pattern is bound as a
+    # parameter so the statement text never changes and can be reused
+    rows = db.fetch_all("""
+        WITH project_schemas AS (
+            SELECT schema_name 
+            FROM information_schema.schemata 
+            WHERE schema_name LIKE $1
+        )
+        SELECT s.schema_name, t.table_name
+        FROM project_schemas s
+        LEFT JOIN information_schema.tables t
+            ON t.table_schema = s.schema_name
+            AND s.schema_name = (SELECT min(schema_name) FROM project_schemas)
+        ORDER BY s.schema_name, t.table_name
+    """, (r"prj\_%",))
+    
+    schema_names = list(dict.fromkeys(row['schema_name'] for row in rows))
     print("\nProject schemas in test database:")
-    for schema in schema_names:
-        print(f"  - {schema['schema_name']}")
+    for schema_name in schema_names:
+        print(f"  - {schema_name}")
     
     print("\nTables in first project schema:")
     if schema_names:
-        first_schema = schema_names[0]['schema_name']
-        tables = db.fetch_all(f"""
-            SELECT table_name 
-            FROM information_schema.tables 
-            WHERE table_schema = '{first_schema}'
-        """)
-        
-        for table in tables:
-            print(f"  - {table['table_name']}")
+        first_schema = schema_names[0]
+        for row in rows:
+            if row['schema_name'] == first_schema and row['table_name']:
+                print(f"  - {row['table_name']}")
     
 @db_operation(mode='mock')  # Mock mode
 def demo_mock_mode(db: DBOperator) -> None:
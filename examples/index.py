@@ -9,7 +9,9 @@ FUNCTIONS:
     - main: Entry point for the example runner
 DEPENDENCIES:
     - os: For directory operations
+    - functools: For caching the example file list
     - importlib: For dynamic module imports
+    - re: For reading example descriptions
     - sys: For system operations
 
 This module serves as a central hub for running all the example scripts in the
@@ -27,11 +29,57 @@ python services/database/examples/index.py run mock_db_example
 """
 
 import os
+import re
 import sys
+import functools
 import importlib
 from pathlib import Path
 from typing import List, Dict, Optional
 
+# Module docstrings sit at the top of each file, so only the head is read
+_DOCSTRING_HEAD_SIZE = 4096
+_PURPOSE_RE = re.compile(r"PURPOSE:\s*(.+)")
+
+_EXAMPLES_DIR = Path(__file__).resolve().parent
+_NON_EXAMPLE_FILES = {"__init__.py", "index.py"}
+
+def _read_description(file_path: str) -> str:
+    """
+    Read an example's description from the PURPOSE line of its docstring.
+    
+    The file is scanned rather than imported, since importing an example
+    pulls in the whole services.database stack.
+    
+    Args:
+        file_path: Path of the example file
+        
+    Returns:
+        The description, or a placeholder if it cannot be read
+    """
+    try:
+        with open(file_path, encoding="utf-8") as f:
+            match = _PURPOSE_RE.search(f.read(_DOCSTRING_HEAD_SIZE))
+        return match.group(1).strip() if match else "No description"
+    except (OSError, UnicodeDecodeError):
+        return "Could not load description"
+
+@functools.lru_cache(maxsize=1)
+def _example_files() -> tuple:
+    """
+    Find the example modules, scanning the directory once per process.
+    
+    Returns:
+        Tuple of (module name, file path) pairs, sorted by name
+    """
+    # A single scandir pass over the directory entries, without building
+    # a Path object for each one
+    with os.scandir(_EXAMPLES_DIR) as it:
+        return tuple(sorted(
+            (entry.name[:-3], entry.path)
+            for entry in it
+            if entry.name.endswith(".py") and entry.name not in _NON_EXAMPLE_FILES
+        ))
+
 def list_examples() -> List[Dict[str, str]]:
     """
     List all available examples in the examples directory.
@@ -39,29 +87,14 @@ def list_examples() -> List[Dict[str, str]]:
     Returns:
         List of dictionaries containing example information
     """
-    examples = []
-    current_dir = Path(__file__).parent
-    
-    for file_path in current_dir.glob("*.py"):
-        if file_path.name in ("__init__.py", "index.py"):
-            continue
-            
-        module_name = file_path.stem
-        
-        # Try to import the module to get its docstring
-        try:
-            module = importlib.import_module(f"services.database.examples.{module_name}")
-            description = module.__doc__.split("PURPOSE:")[1].split("\n")[0].strip() if module.__doc__ else "No description"
-        except Exception:
-            description = "Could not load description"
-        
-        examples.append({
+    return [
+        {
             "name": module_name,
-            "description": description,
-            "path": str(file_path)
-        })
-    
-    return sorted(examples, key=lambda x: x["name"])
+            "description": _read_description(file_path),
+            "path": file_path
+        }
+        for module_name, file_path in _example_files()
+    ]
 
 def run_example(example_name: str) -> int:
     """
@@ -73,18 +106,16 @@ def run_example(example_name: str) -> int:
     Returns:
         Exit code (0 for success, 1 for failure)
     """
-    examples = list_examples()
-    matching_examples = [ex for ex in examples if ex["name"] == example_name]
+    # Only the selected example is looked up, rather than listing them all
+    file_path = dict(_example_files()).get(example_name)
     
-    if not matching_examples:
+    if file_path is None:
         print(f"Error: Example '{example_name}' not found.")
         print("Use 'python services/database/examples/index.py list' to see available examples.")
         return 1
     
-    example = matching_examples[0]
-    
-    print(f"\n=== Running Example: {example['name']} ===")
-    print(f"Description: {example['description']}")
+    print(f"\n=== Running Example: {example_name} ===")
+    print(f"Description: {_read_description(file_path)}")
     print("=" * 60)
     
     try:
@@ -126,16 +157,17 @@ def main() -> int:
     
     if command == "list":
         examples = list_examples()
-        print("\nAvailable Examples:")
-        print("-" * 80)
-        for i, example in enumerate(examples):
-            print(f"{i+1}. {example['name']}")
-            print(f"   {example['description']}")
-            print()
-        
-        print(f"\nFound {len(examples)} examples.")
-        print("\nTo run an example:")
-        print("  python services/database/examples/index.py run <example_name>")
+        # Build the whole listing and write it at once, rather than making
+        # several print calls per example
+        lines = ["\nAvailable Examples:\n", "-" * 80, "\n"]
+        lines.extend(
+            f"{i+1}. {example['name']}\n   {example['description']}\n\n"
+            for i, example in enumerate(examples)
+        )
+        lines.append(f"\nFound {len(examples)} examples.\n")
+        lines.append("\nTo run an example:\n")
+        lines.append("  python services/database/examples/index.py run <example_name>\n")
+        sys.stdout.write("".join(lines))
         return 0
     
     elif command == "run":
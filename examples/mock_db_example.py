@@ -23,12 +23,8 @@ The script will demonstrate:
 3. Validating mock data against the schema
 """
 
-import json
 from typing import Dict, Any, List, Optional
 
-# Import database components
-from services.database import DBOperator, SchemaRegistry, MockDataGenerator
-
 def pretty_print(data: Any) -> None:
     """
     Pretty print data as JSON.
@@ -36,12 +32,18 @@ def pretty_print(data: Any) -> None:
     Args:
         data: Data to print
     """
+    import json
+    
     print(json.dumps(data, indent=2, default=str))
 
 def main() -> None:
     """
     Entry point for the mock database example.
     """
+    # Import database components here so that importing this module
+    # stays cheap; the package is only needed once the example runs
+    from services.database import DBOperator, SchemaRegistry, MockDataGenerator
+    
     print("\n=== Mock Database Example ===\n")
     
     # Create a schema registry and initialize it
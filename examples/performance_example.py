@@ -23,14 +23,12 @@ python services/database/examples/performance_example.py
 """
 
 import time
-import statistics
 from typing import Dict, Any, List, Optional
-import random
-from datetime import datetime, timedelta
 
-# Import database components
+# Import database components. time_query is applied at import time, so
+# these cannot be deferred
 from services.database import DBOperator
-from services.database.performance import QueryLogger, time_query, QueryLogEntry
+from services.database.performance import QueryLogger, time_query
 
 def run_example_queries(db: DBOperator, iterations: int = 5) -> None:
     """
@@ -40,6 +38,8 @@ def run_example_queries(db: DBOperator, iterations: int = 5) -> None:
         db: Database operator
         iterations: Number of iterations to run for each query
     """
+    import random
+    
     print("\n=== Running Example Queries ===\n")
     
     # Example 1: Basic query
@@ -105,6 +105,8 @@ def decorated_example_query(db: DBOperator) -> List[Dict[str, Any]]:
     Returns:
         List of query results
     """
+    import random
+    
     # Simulate query execution time
     time.sleep(random.uniform(0.05, 0.15))
     
@@ -127,6 +129,8 @@ def analyze_logs(query_logger: QueryLogger) -> None:
     Args:
         query_logger: Query logger instance with collected logs
     """
+    import statistics
+    
     logs = query_logger.get_logs()
     
     print("\n=== Query Performance Analysis ===\n")
@@ -136,7 +140,7 @@ def analyze_logs(query_logger: QueryLogger) -> None:
     # Group logs by query type
     query_groups = {}
     for log in logs:
-        query = log.sql.strip().split('\n')[0].strip()  # Get first line of query
+        query = log.sql.strip().split('\n', 1)[0].strip()  # Get first line of query
         if query not in query_groups:
             query_groups[query] = []
         query_groups[query].append(log)
@@ -169,7 +173,8 @@ def analyze_logs(query_logger: QueryLogger) -> None:
         print("-" * 80)
         
         for log in sorted(slow_logs, key=lambda x: x.execution_time_ms, reverse=True):
-            query_display = (log.sql.split('\n')[0][:47] + '...') if len(log.sql.split('\n')[0]) > 50 else log.sql.split('\n')[0]
+            first_line = log.sql.split('\n', 1)[0]
+            query_display = (first_line[:47] + '...') if len(first_line) > 50 else first_line
             timestamp = log.timestamp.strftime("%Y-%m-%d %H:%M:%S")
             print(f"{query_display:<50} | {log.execution_time_ms:<10.2f} | {timestamp:<20}")
 
@@ -24,10 +24,6 @@ python services/database/examples/sync_example.py
 import os
 import sys
 from pathlib import Path
-from datetime import datetime
-
-# Import sync components
-from services.database.sync import DatabaseSyncManager
 
 def main() -> None:
     """
@@ -36,6 +32,11 @@ def main() -> None:
     This function demonstrates how to use the DatabaseSyncManager
     to perform various database synchronization operations.
     """
+    # Import sync components here so that importing this module stays
+    # cheap; they are only needed once the example runs
+    from datetime import datetime
+    from services.database.sync import DatabaseSyncManager
+    
     print("\n=== Database Synchronization Example ===\n")
     
     # Create a sync manager for the test database
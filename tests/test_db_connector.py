@@ -87,4 +87,34 @@ async def test_db_connector_simple_operations():
         
     finally:
         # Clean up
-        await db.close() 
\ No newline at end of file
+        await db.close()
+
+def test_db_connector_new_event_loop():
+    """Test that the pool is rebuilt when each call runs in a new event loop."""
+    db = DBConnector()
+    
+    async def query(close: bool):
+        try:
+            return await db.execute("SELECT 1 as test", fetch_val=True)
+        finally:
+            if close:
+                await db.close()
+    
+    # The first loop's pool is left open, as a Celery task would leave it
+    assert asyncio.run(query(close=False)) == 1
+    assert asyncio.run(query(close=True)) == 1
+
+def test_json_encode_without_orjson(monkeypatch):
+    """Test that the json fallback accepts the same values as orjson."""
+    import datetime
+    import json
+    import uuid
+    from services.database import db_connector
+    
+    value = {"id": uuid.UUID(int=1), "at": datetime.datetime(2024, 1, 2, 3, 4, 5)}
+    monkeypatch.setattr(db_connector, "orjson", None)
+    
+    assert json.loads(db_connector._json_encode(value)) == {
+        "id": "00000000-0000-0000-0000-000000000001",
+        "at": "2024-01-02T03:04:05"
+    }
@@ -22,6 +22,7 @@ import asyncio
 from typing import Dict, Any
 
 from services.database.db_operator import DBOperator, ColumnMatchError
+from services.database.db_connector import SchemaError
 from services.database.schema_setup import SchemaSetup
 
 # Test schema name (will be created and dropped for tests)
@@ -140,6 +141,20 @@ class TestDBOperator:
         assert retrieved["username"] == "johndoe"
         assert retrieved["email"] == "john@example.com"
     
+    @pytest.mark.asyncio
+    async def test_insert_many(self, db_operator, setup_test_schema):
+        """Test inserting several records in batches, including via COPY."""
+        rows = [{"username": f"bulk{i}", "email": f"bulk{i}@example.com"} for i in range(3)]
+        rows.append({"username": "bulk3"})
+        
+        db_operator.copy_threshold = 3
+        inserted = await db_operator.insert_many("test_users", rows, schema=TEST_SCHEMA)
+        
+        assert inserted == 4
+        records = await db_operator.fetch("test_users", order_by="username", schema=TEST_SCHEMA)
+        assert [r["username"] for r in records] == ["bulk0", "bulk1", "bulk2", "bulk3"]
+        assert records[3]["email"] is None
+    
     @pytest.mark.asyncio
     async def test_get_by_name(self, db_operator, test_user):
         """Test retrieving a record by name."""
@@ -211,6 +226,30 @@ class TestDBOperator:
         
         assert len(all_users) == 2
     
+    @pytest.mark.asyncio
+    async def test_fetch_unknown_table(self, db_operator, setup_test_schema):
+        """Test that unknown or malformed table names raise SchemaError."""
+        with pytest.raises(SchemaError):
+            await db_operator.fetch("no_such_table", schema=TEST_SCHEMA)
+        
+        with pytest.raises(SchemaError):
+            await db_operator.fetch("test_users", schema="no_such_schema")
+        
+        # Names are never put into the query unchecked
+        with pytest.raises(SchemaError):
+            await db_operator.fetch("test_users UNION SELECT 1 --", schema=TEST_SCHEMA)
+    
+    @pytest.mark.asyncio
+    async def test_table_exists_after_ddl(self, db_operator, setup_test_schema):
+        """Test that DDL run through the operator refreshes cached existence checks."""
+        assert not await db_operator.table_exists("ddl_check", schema=TEST_SCHEMA)
+        
+        await db_operator.execute_raw(f"CREATE TABLE {TEST_SCHEMA}.ddl_check (id int)")
+        assert await db_operator.table_exists("ddl_check", schema=TEST_SCHEMA)
+        
+        await db_operator.execute(f"DROP TABLE {TEST_SCHEMA}.ddl_check")
+        assert not await db_operator.table_exists("ddl_check", schema=TEST_SCHEMA)
+    
     @pytest.mark.asyncio
     async def test_delete(self, db_operator, test_user):
         """Test deleting a record."""
@@ -284,6 +323,20 @@ class TestDBOperator:
         assert "Column 'nonexistent_column' not found" in str(exc_info.value)
         assert "Available columns" in str(exc_info.value)
     
+    def test_clean_response_filters(self):
+        """Test that SQL keywords and shell commands are tagged in stored responses."""
+        # Pure string handling, so no connection is needed
+        operator = DBOperator.__new__(DBOperator)
+        
+        assert operator._clean_response_inner("a; DELETE from x") == "a;[FILTERED SQL]DELETEfrom x"
+        
+        # The command filter runs after the SQL filter, on its output
+        assert operator._clean_response_inner("SELECT rm -rf /") == "[FILTERED SQL]SELECTrm -rf /"
+        assert operator._clean_response_inner("sudo DROP table") == "sudo[FILTERED SQL]DROPtable"
+        
+        # C0 control characters are dropped, except tab, LF and CR
+        assert operator._clean_response_inner("a\x00b\x07c\x1bd\te\r\nf") == "abcd\te\r\nf"
+    
     @pytest.mark.asyncio
     async def test_transaction(self, db_operator, setup_test_schema):
         """Test transaction handling."""
@@ -292,7 +345,7 @@ class TestDBOperator:
             # Insert a user
             await conn.execute(
                 f"INSERT INTO {TEST_SCHEMA}.test_users (username, email) VALUES ($1, $2)",
-                ("transaction_user", "transaction@example.com")
+                "transaction_user", "transaction@example.com"
             )
             
             # Insert an item for the user
@@ -301,7 +354,7 @@ class TestDBOperator:
                 INSERT INTO {TEST_SCHEMA}.test_items (name, description, user_id) 
                 VALUES ($1, $2, (SELECT id FROM {TEST_SCHEMA}.test_users WHERE username = $3))
                 """,
-                ("Transaction Item", "Created in transaction", "transaction_user")
+                "Transaction Item", "Created in transaction", "transaction_user"
             )
         
         # Verify both records were created
@@ -329,7 +382,7 @@ class TestDBOperator:
                 # Insert a user
                 await conn.execute(
                     f"INSERT INTO {TEST_SCHEMA}.test_users (username, email) VALUES ($1, $2)",
-                    ("rollback_user", "rollback@example.com")
+                    "rollback_user", "rollback@example.com"
                 )
                 
                 # This will fail due to an invalid user ID
@@ -338,7 +391,7 @@ class TestDBOperator:
                     INSERT INTO {TEST_SCHEMA}.test_items (name, description, user_id) 
                     VALUES ($1, $2, $3)
                     """,
-                    ("Rollback Item", "Will be rolled back", "invalid-uuid")
+                    "Rollback Item", "Will be rolled back", "invalid-uuid"
                 )
         
         # Verify the user was not created (transaction rolled back)
@@ -0,0 +1,205 @@
+"""
+MODULE: services/database/tests/test_sql_script.py
+PURPOSE: Tests for the SQL script splitting helpers of the database operator
+DEPENDENCIES:
+    - pytest: For testing
+    - services.database.db_operator: For the script helpers under test
+
+This module tests how run_sql_script and run_sql_file split a script into
+statements, batch DML and load COPY data. No database is needed.
+"""
+
+import codecs
+import pytest
+from unittest.mock import AsyncMock
+
+from services.database.db_connector import QueryError
+from services.database.db_operator import (
+    DBOperator,
+    _split_sql_script,
+    _take_sql_statements,
+    _group_sql_statements,
+    _COPY_FROM_STDIN_RE,
+    _SCRIPT_BATCH_SIZE
+)
+
+# Script mixing every construct that can span a chunk boundary, with
+# multi-byte UTF-8 characters inside strings, comments and COPY data and
+# a COPY block with CRLF line endings
+STREAMED_SCRIPT = (
+    "-- header; comment\n"
+    "CREATE TABLE t (a int, b text);\n"
+    "INSERT INTO t VALUES (1, 'café; € ''q''');\n"
+    "CREATE FUNCTION f() RETURNS text AS $body$ SELECT 'x;y' $body$ LANGUAGE sql;\n"
+    "/* block; \U0001F600 */\n"
+    "COPY public.t (a, b) FROM stdin;\n1\tnaïve;\n2\t\\N\n\\.\n"
+    "COPY t (a) FROM stdin;\r\n3\r\n\\.\r\n"
+    "SELECT \"we;ird\" FROM t;\n"
+)
+
+def _stream_statements(data: bytes, chunk_size: int):
+    """Split encoded script data the way run_sql_file does, chunk by chunk."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    statements = []
+    pending = ""
+    for i in range(0, len(data), chunk_size):
+        pending += decoder.decode(data[i:i + chunk_size])
+        complete, pending = _take_sql_statements(pending, final=False)
+        statements.extend(complete)
+    complete, _ = _take_sql_statements(pending + decoder.decode(b"", final=True), final=True)
+    return statements + complete
+
+def test_split_plain_statements():
+    """Test that statements are split on semicolons and stripped."""
+    assert _split_sql_script("SELECT 1;\n  SELECT 2;\nSELECT 3") == ["SELECT 1;", "SELECT 2;", "SELECT 3"]
+
+def test_split_dollar_quoted_body():
+    """Test that semicolons inside dollar-quoted bodies do not end a statement."""
+    script = (
+        "CREATE FUNCTION f() RETURNS int AS $$ BEGIN x := 1; RETURN 1; END; $$ LANGUAGE plpgsql;\n"
+        "CREATE FUNCTION g() RETURNS text AS $body$ SELECT '$$;' $body$ LANGUAGE sql;"
+        "SELECT 1;"
+    )
+    
+    assert _split_sql_script(script) == [
+        "CREATE FUNCTION f() RETURNS int AS $$ BEGIN x := 1; RETURN 1; END; $$ LANGUAGE plpgsql;",
+        "CREATE FUNCTION g() RETURNS text AS $body$ SELECT '$$;' $body$ LANGUAGE sql;",
+        "SELECT 1;"
+    ]
+
+def test_split_comments():
+    """Test that semicolons in comments are ignored and comment-only fragments dropped."""
+    script = "SELECT /* ; */ 1; -- a; b\nSELECT 2;\n-- trailing; comment\n/* block; */"
+    
+    assert _split_sql_script(script) == ["SELECT /* ; */ 1;", "-- a; b\nSELECT 2;"]
+
+def test_split_quoted_text():
+    """Test that semicolons in string literals and quoted identifiers are ignored."""
+    script = "INSERT INTO t VALUES ('a;b', 'it''s;');SELECT \"we;ird\" FROM t"
+    
+    assert _split_sql_script(script) == ["INSERT INTO t VALUES ('a;b', 'it''s;');", 'SELECT "we;ird" FROM t']
+
+def test_split_copy_block():
+    """Test that a COPY ... FROM stdin statement keeps its data up to the terminator."""
+    script = "COPY public.t (a, b) FROM stdin;\n1\tx;y\n2\t'z\n\\.\nSELECT 1;"
+    
+    assert _split_sql_script(script) == ["COPY public.t (a, b) FROM stdin;\n1\tx;y\n2\t'z\n\\.", "SELECT 1;"]
+
+def test_stream_matches_whole_script_split():
+    """Test that every chunk size gives the same statements as splitting the whole script."""
+    data = STREAMED_SCRIPT.encode("utf-8")
+    expected = _split_sql_script(STREAMED_SCRIPT)
+    
+    assert len(expected) == 6
+    assert expected[4] == "COPY t (a) FROM stdin;\r\n3\r\n\\."
+    for chunk_size in range(1, len(data) + 1):
+        assert _stream_statements(data, chunk_size) == expected, f"chunk_size={chunk_size}"
+
+@pytest.mark.parametrize("partial", [
+    "SELECT 'a;",
+    "SELECT $$ a;",
+    "SELECT /* a;",
+    "COPY t FROM stdin;\n1\t;\n"
+])
+def test_stream_stops_inside_open_token(partial):
+    """Test that text ending inside a string, dollar quote, comment or COPY block is kept back."""
+    statements, rest = _take_sql_statements("SELECT 1;\n" + partial, final=False)
+    
+    assert statements == ["SELECT 1;"]
+    assert rest == "\n" + partial
+
+def test_copy_from_stdin_header():
+    """Test that the COPY header regex finds the schema, table and columns."""
+    match = _COPY_FROM_STDIN_RE.match('-- data\nCOPY "My Schema".Items ("Id", name) FROM stdin;\n1\tx\n\\.')
+    
+    assert match.group("schema", "table", "columns") == ('"My Schema"', "Items", '"Id", name')
+    assert _COPY_FROM_STDIN_RE.match("COPY items FROM stdin;\n").group("schema", "columns", "options") == (None, None, "")
+    assert _COPY_FROM_STDIN_RE.match("COPY items FROM stdin WITH (FORMAT csv);\r\n").group("options") == " WITH (FORMAT csv)"
+
+@pytest.mark.asyncio
+async def test_copy_from_stdin_sends_data():
+    """Test that COPY data is sent without the terminator line, with names resolved."""
+    operator = DBOperator.__new__(DBOperator)
+    operator._connector = AsyncMock()
+    statement = 'COPY "My Schema".Items ("Id", name) FROM stdin;\n1\tx;y\n2\t\\N\n\\.'
+    
+    await operator._copy_from_stdin(statement, _COPY_FROM_STDIN_RE.match(statement))
+    
+    operator._connector.copy_text.assert_awaited_once_with(
+        "items",
+        "1\tx;y\n2\t\\N\n",
+        columns=["Id", "name"],
+        schema="My Schema"
+    )
+
+@pytest.mark.parametrize("options", ["WITH (FORMAT csv, HEADER true)", "CSV HEADER", "DELIMITER ','"])
+@pytest.mark.asyncio
+async def test_copy_from_stdin_rejects_options(options):
+    """Test that COPY options are reported by name instead of being sent as plain SQL."""
+    operator = DBOperator.__new__(DBOperator)
+    operator._connector = AsyncMock()
+    statement = f"COPY items (a, b) FROM stdin {options};\n1,x\n\\."
+    
+    with pytest.raises(QueryError, match="Unsupported COPY") as exc_info:
+        await operator._copy_from_stdin(statement, _COPY_FROM_STDIN_RE.match(statement))
+    
+    assert options in str(exc_info.value)
+    operator._connector.copy_text.assert_not_awaited()
+
+def test_group_mixed_statements():
+    """Test that only consecutive DML statements share a group."""
+    statements = [
+        "CREATE TABLE t (a int);",
+        "INSERT INTO t VALUES (1);",
+        "insert into t values (2);",
+        "UPDATE t SET a = 3;",
+        "CREATE INDEX t_a ON t (a);",
+        "DELETE FROM t;"
+    ]
+    
+    assert _group_sql_statements(statements) == [
+        (0, statements[0:1]),
+        (1, statements[1:4]),
+        (4, statements[4:5]),
+        (5, statements[5:6])
+    ]
+
+def test_group_comment_prefixed_dml():
+    """Test that DML preceded by comments is still batched."""
+    statements = [
+        "-- seed data\nINSERT INTO t VALUES (1);",
+        "/* more */ INSERT INTO t VALUES (2);",
+        "-- schema change\nALTER TABLE t ADD COLUMN b int;"
+    ]
+    
+    assert _group_sql_statements(statements) == [(0, statements[0:2]), (2, statements[2:3])]
+
+def test_group_size_is_capped():
+    """Test that a long run of DML is split into groups of at most _SCRIPT_BATCH_SIZE."""
+    statements = [f"INSERT INTO t VALUES ({i});" for i in range(2 * _SCRIPT_BATCH_SIZE + 1)]
+    groups = _group_sql_statements(statements)
+    
+    assert [(start, len(group)) for start, group in groups] == [
+        (0, _SCRIPT_BATCH_SIZE),
+        (_SCRIPT_BATCH_SIZE, _SCRIPT_BATCH_SIZE),
+        (2 * _SCRIPT_BATCH_SIZE, 1)
+    ]
+    assert [statement for _, group in groups for statement in group] == statements
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_replayed_one_by_one():
+    """Test that a failed batch is rerun statement by statement to report the culprit."""
+    operator = DBOperator.__new__(DBOperator)
+    operator._connector = AsyncMock()
+    statements = ["INSERT INTO t VALUES (1);", "INSERT INTO t VALUES (2);", "INSERT INTO t VALUES (x);"]
+    
+    async def execute(query):
+        if "(x)" in query:
+            raise QueryError("column x does not exist")
+    operator._connector.execute.side_effect = execute
+    
+    with pytest.raises(QueryError, match="statement 3/3"):
+        await operator._run_sql_statements(statements, 0, len(statements))
+    
+    sent = [call.args[0] for call in operator._connector.execute.await_args_list]
+    assert sent == ["\n".join(statements)] + statements
@@ -40,6 +40,11 @@ except ImportError:
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Keywords that must be quoted when used as column names
+_QUOTED_KEYWORDS = frozenset({"SELECT", "FROM", "WHERE", "JOIN", "GROUP", "ORDER", "BY", "HAVING", "LIMIT", "OFFSET"})
+
+_QUOTE_CHARS_RE = re.compile(r'["\']')
+
 def format_query_params(params: Any) -> str:
     """
     Format query parameters for logging or display.
@@ -128,13 +133,10 @@ def format_column_name(column_name: str) -> str:
         Formatted column name
     """
     # Remove any quotes that might already be there
-    clean_name = re.sub(r'["\']', '', column_name)
+    clean_name = _QUOTE_CHARS_RE.sub('', column_name)
     
     # Check if the column name needs quoting (contains special characters or keywords)
-    needs_quotes = (
-        not clean_name.isalnum() or 
-        clean_name.upper() in ["SELECT", "FROM", "WHERE", "JOIN", "GROUP", "ORDER", "BY", "HAVING", "LIMIT", "OFFSET"]
-    )
+    needs_quotes = not clean_name.isalnum() or clean_name.upper() in _QUOTED_KEYWORDS
     
     if needs_quotes:
         return f'"{clean_name}"'